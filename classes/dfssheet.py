@@ -13,9 +13,15 @@ class Sheet(object):
         # authorize class to use sheets API
         self.service = self.setup_service()
 
+        # build the spreadsheets().values() resource once and reuse it for every request
+        self.sheet_values = self.service.spreadsheets().values()
+
         # unique ID for DFS Ownership/Value spreadsheet
         self.SPREADSHEET_ID = "1Jv5nT-yUoEarkzY5wa7RW0_y0Dqoj8_zDrjeDs-pHL4"
 
+        # sheet properties from the spreadsheet metadata, loaded on first find_sheet_id()
+        self.sheet_properties = None
+
     def setup_service(self):
         SCOPES = "https://www.googleapis.com/auth/spreadsheets"
         dir = "."
@@ -27,48 +33,51 @@ class Sheet(object):
         return build("sheets", "v4", http=creds.authorize(Http()), cache_discovery=False)
 
     def find_sheet_id(self, title):
-        sheet_metadata = (
-            self.service.spreadsheets().get(spreadsheetId=self.SPREADSHEET_ID).execute()
-        )
-        sheets = sheet_metadata.get("sheets", "")
-        for sheet in sheets:
-            if title in sheet["properties"]["title"]:
-                # logger.debug("Sheet ID for {} is {}".format(title, sheet["properties"]["sheetId"]))
-                return sheet["properties"]["sheetId"]
+        # pull the metadata once and search it locally on subsequent lookups
+        if self.sheet_properties is None:
+            sheet_metadata = (
+                self.service.spreadsheets().get(spreadsheetId=self.SPREADSHEET_ID).execute()
+            )
+            self.sheet_properties = [
+                sheet["properties"] for sheet in sheet_metadata.get("sheets", "")
+            ]
+
+        for properties in self.sheet_properties:
+            if title in properties["title"]:
+                # logger.debug("Sheet ID for {} is {}".format(title, properties["sheetId"]))
+                return properties["sheetId"]
 
     def write_values_to_sheet_range(self, values, range):
         """Write a set of values to a column in a spreadsheet."""
         body = {"values": values}
         value_input_option = "USER_ENTERED"
-        result = (
-            self.service.spreadsheets()
-            .values()
-            .update(
-                spreadsheetId=self.SPREADSHEET_ID,
-                range=range,
-                valueInputOption=value_input_option,
-                body=body,
-            )
-            .execute()
-        )
+        result = self.sheet_values.update(
+            spreadsheetId=self.SPREADSHEET_ID,
+            range=range,
+            valueInputOption=value_input_option,
+            body=body,
+        ).execute()
         logger.info("{0} cells updated.".format(result.get("updatedCells")))
 
+    def write_values_to_sheet_ranges(self, data):
+        """Write several (range, values) pairs to a spreadsheet with a single request."""
+        body = {
+            "valueInputOption": "USER_ENTERED",
+            "data": [{"range": range, "values": values} for range, values in data],
+        }
+        result = self.sheet_values.batchUpdate(
+            spreadsheetId=self.SPREADSHEET_ID, body=body
+        ).execute()
+        logger.info("{0} cells updated.".format(result.get("totalUpdatedCells")))
+
     def get_values_from_self_range(self):
-        result = (
-            self.service.spreadsheets()
-            .values()
-            .get(spreadsheetId=self.SPREADSHEET_ID, range=self.cell_range)
-            .execute()
-        )
+        result = self.sheet_values.get(
+            spreadsheetId=self.SPREADSHEET_ID, range=self.cell_range
+        ).execute()
         return result.get("values", [])
 
     def get_values_from_range(self, range):
-        result = (
-            self.service.spreadsheets()
-            .values()
-            .get(spreadsheetId=self.SPREADSHEET_ID, range=range)
-            .execute()
-        )
+        result = self.sheet_values.get(spreadsheetId=self.SPREADSHEET_ID, range=range).execute()
         return result.get("values", [])
 
     def sheet_letter_to_index(self, letter):
@@ -127,11 +136,25 @@ class DFSSheet(Sheet):
         cell_range = f"{self.sport}!{column}2:{column}"
         return super().write_values_to_sheet_range(cell_range, values)
 
+    def write_results(self, players, dt, vips):
+        """Write players, last updated time and VIP lineups in one batch request."""
+        data = [
+            (f"{self.sport}!{self.data_range}", players),
+            (f"{self.sport}!L1:Q1", self.build_values_for_last_updated(dt)),
+        ]
+        if vips:
+            cell_range = self.LINEUP_RANGES[self.sport]
+            data.append((f"{self.sport}!{cell_range}", self.build_values_for_vip_lineups(vips)))
+        self.write_values_to_sheet_ranges(data)
+
     def add_last_updated(self, dt):
         cell_range = f"{self.sport}!L1:Q1"
-        values = [["Last Updated", "", dt.strftime("%Y-%m-%d %H:%M:%S")]]
+        values = self.build_values_for_last_updated(dt)
         self.write_values_to_sheet_range(values, cell_range)
 
+    def build_values_for_last_updated(self, dt):
+        return [["Last Updated", "", dt.strftime("%Y-%m-%d %H:%M:%S")]]
+
     def build_values_for_vip_lineup(self, vip):
         values = [
             [vip.name, "", "PMR", vip.pmr, "", ""],
@@ -153,6 +176,10 @@ class DFSSheet(Sheet):
 
     def write_vip_lineups(self, vips):
         cell_range = self.LINEUP_RANGES[self.sport]
+        all_lineup_values = self.build_values_for_vip_lineups(vips)
+        self.write_values_to_sheet_range(all_lineup_values, f"{self.sport}!{cell_range}")
+
+    def build_values_for_vip_lineups(self, vips):
         lineup_mod = 2
         # add size of lineup + 3 for extra rows
         sport_mod = len(vips[0].lineup) + 3
@@ -170,7 +197,7 @@ class DFSSheet(Sheet):
             # add extra row to values for spacing if needed
             if i != lineup_mod:
                 all_lineup_values.append([])
-        self.write_values_to_sheet_range(all_lineup_values, f"{self.sport}!{cell_range}")
+        return all_lineup_values
 
     def get_players(self):
         return [row[self.columns.index("Name")] for row in self.values]
@@ -1,13 +1,12 @@
 import logging
-import logging.config
-
-# load the logging configuration
-logging.config.fileConfig("logging.ini")
 
 
 class Player(object):
     """Create a Player object to represent an athlete for a given sport."""
 
+    # game_info values that are a status rather than a matchup
+    GAME_STATUSES = {"In Progress", "Final", "Postponed", "UNKNOWN", "Suspended", "Delayed"}
+
     def __init__(self, name, pos, salary, game_info, team_abbv, logger=None):
         self.logger = logger or logging.getLogger(__name__)
 
@@ -29,7 +28,7 @@ class Player(object):
     def update_stats(self, pos, perc, fpts):
         """Update class variables from contest standings file (contest-standings-nnnnnnnn.csv)."""
         self.standings_pos = pos
-        self.ownership = float(perc.replace("%", "")) / 100
+        self.ownership = float(perc.rstrip("%")) / 100
         self.fpts = float(fpts)
 
         # calculate value
@@ -48,21 +47,10 @@ class Player(object):
         if "@" not in self.game_info:
             return self.game_info
 
-        if self.game_info in [
-            "In Progress",
-            "Final",
-            "Postponed",
-            "UNKNOWN",
-            "Suspended",
-            "Delayed",
-        ]:
+        if self.game_info in self.GAME_STATUSES:
             return self.game_info
 
-        # split game info into matchup_info
-        home_team, a = self.game_info.split("@")
-        away_team, match_time = a.split(" ", 1)
-        # self.logger.debug("home_team: {} away_team: {} t: {}".format(
-        #     home_team, away_team, match_time))
+        # split game info into matchup_info - only the teams before the game time are needed
         home_team, away_team = self.game_info.split(" ", 1)[0].split("@")
         if self.team_abbv == home_team:
             matchup_info = "vs. {}".format(away_team)
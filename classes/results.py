@@ -1,20 +1,30 @@
 import csv
 from datetime import datetime
+import functools
 import io
 import logging
-import logging.config
 import unicodedata
 
 from .player import Player
 from .user import User
 
-# load the logging configuration
-logging.config.fileConfig("logging.ini")
-
 
 class Results(object):
     """Create a Results object which contains the results for a given DraftKings contest."""
 
+    # positions for each sport (sets, since every lineup token is checked against them)
+    POSITIONS = {
+        "CFL": {"QB", "RB", "WR", "TE", "FLEX", "S-FLEX"},
+        "MLB": {"P", "C", "1B", "2B", "3B", "SS", "OF"},
+        "NBA": {"PG", "SG", "SF", "PF", "C", "G", "F", "UTIL"},
+        "NFL": {"QB", "RB", "WR", "TE", "FLEX", "DST"},
+        "NHL": {"C", "W", "D", "G", "UTIL"},
+        "PGAMain": {"G"},
+        "PGAWeekend": {"WG"},
+        "PGAShowdown": {"G"},
+        "TEN": {"P"},
+    }
+
     def __init__(self, sport, contest_id, salary_csv_fn, logger=None):
         self.logger = logger or logging.getLogger(__name__)
 
@@ -29,7 +39,8 @@ class Results(object):
 
         self.parse_salary_csv(salary_csv_fn)
 
-        self.vips = [
+        # set, since every row of the standings CSV is checked against it
+        self.vips = {
             "aplewandowski",
             "FlyntCoal",
             "Cubbiesftw23",
@@ -38,7 +49,7 @@ class Results(object):
             "Notorious",
             "Bra3105",
             "ChipotleAddict",
-        ]
+        }
         self.vip_list = []  # list of VIPs found in standings CSV
 
         # contest_fn = 'contest-standings-73990354.csv'
@@ -48,7 +59,7 @@ class Results(object):
         self.parse_contest_standings_csv(contest_fn)
 
         for vip in self.vip_list:
-            self.logger.debug(f"VIP: {vip}")
+            self.logger.debug("VIP: %s", vip)
             # vip.lineup = self.parse_lineup_string(vip.lineup_str)
             vip.set_lineup(self.parse_lineup_string(vip.lineup_str))
 
@@ -58,54 +69,35 @@ class Results(object):
     def parse_lineup_string(self, lineup_str):
         """Parse VIP's lineup_str and return list of Players."""
         player_list = []
-        # dict of positions for each sport
-        positions = {
-            "CFL": ["QB", "RB", "WR", "TE", "FLEX", "S-FLEX"],
-            "MLB": ["P", "C", "1B", "2B", "3B", "SS", "OF"],
-            "NBA": ["PG", "SG", "SF", "PF", "C", "G", "F", "UTIL"],
-            "NFL": ["QB", "RB", "WR", "TE", "FLEX", "DST"],
-            "NHL": ["C", "W", "D", "G", "UTIL"],
-            "PGAMain": ["G"],
-            "PGAWeekend": ["WG"],
-            "PGAShowdown": ["G"],
-            "TEN": ["P"],
-        }
-        splt = lineup_str.split(" ")
-
-        # list comp for indicies of positions in splt
-        indices = [i for i, pos in enumerate(splt) if pos in positions[self.sport]]
-        # list comp for ending indices in splt. for splicing, the second argument is exclusive
-        end_indices = [indices[i] for i in range(1, len(indices))]
-        # append size of splt as last index
-        end_indices.append(len(splt))
-        # self.logger.debug("indices: {}".format(indices))
-        # self.logger.debug("end_indices: {}".format(end_indices))
-        for i, index in enumerate(indices):
-            s = slice(index + 1, end_indices[i])
-            name = splt[s]
-            if name != "LOCKED":
-                # self.logger.debug(name)
-                name = " ".join(name)
+        sport_positions = self.POSITIONS[self.sport]
 
-                # ensure name doesn't have any weird characters
-                name = self.strip_accents_and_periods(name)
+        # single pass over the tokens: a position starts a new name, anything else extends it
+        names = []
+        for token in lineup_str.split(" "):
+            if token in sport_positions:
+                names.append([])
+            elif names:
+                names[-1].append(token)
 
-                if name in self.players:
-                    player_list.append(self.players[name])
+        for name in names:
+            # ensure name doesn't have any weird characters
+            name = self.strip_accents_and_periods(" ".join(name))
 
-            if "LOCKED" in name:
-                name = "LOCKED 🔒"
+            # locked slots ("LOCKED") never match a player
+            if name in self.players:
+                player_list.append(self.players[name])
 
         return player_list
 
-    def strip_accents_and_periods(self, name):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def strip_accents_and_periods(name):
         """Strip accents from a given string and replace with letters without accents."""
+        # cached since the same names show up in the salary CSV, standings CSV and lineups
         # TODO might not want to remove periods for the actual sheet
         return "".join(
-            c.replace(".", "")
-            for c in unicodedata.normalize("NFD", name)
-            if unicodedata.category(c) != "Mn"
-        )
+            c for c in unicodedata.normalize("NFD", name) if unicodedata.category(c) != "Mn"
+        ).replace(".", "")
 
     def parse_salary_csv(self, fn):
         """Parse CSV containing players and salary information."""
@@ -164,12 +156,8 @@ class Results(object):
             return list(rdr)
 
     def players_to_values(self):
-        # sort players by ownership
-        sorted_players = sorted(self.players, key=lambda x: self.players[x].ownership, reverse=True)
-        # for p in self.players.values():
-        #     print(p.perc)
-        #     print()
-        return [
-            self.players[p].writeable() for p in sorted_players if self.players[p].ownership > 0
-        ]
+        # only owned players are written, so drop the rest before sorting by ownership
+        owned_players = [p for p in self.players.values() if p.ownership > 0]
+        owned_players.sort(key=lambda p: p.ownership, reverse=True)
+        return [p.writeable() for p in owned_players]
 
@@ -1,10 +1,3 @@
-import logging
-import logging.config
-
-# load the logging configuration
-logging.config.fileConfig("logging.ini")
-
-
 class User(object):
     """Create a User object to represent a DraftKings user."""
 
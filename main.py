@@ -9,6 +9,7 @@ https://www.draftkings.com/lineup/getavailableplayerscsv?contestTypeId=70&draftG
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import csv
 import datetime
 import io
@@ -23,7 +24,9 @@ import browsercookie
 import requests
 import selenium.webdriver.chrome.service as chrome_service
 from pytz import timezone
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
+from urllib3.util.retry import Retry
 
 from classes.dfssheet import DFSSheet
 from classes.results import Results
@@ -36,13 +39,23 @@ logger = logging.getLogger(__name__)
 
 def pull_contest_zip(contest_id):
     """Pull contest file (so far can be .zip or .csv file)."""
+    # share one session between attempts so the connection to draftkings is reused
+    s = requests.Session()
+    # retry transient draftkings errors instead of failing the whole attempt
+    retries = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    s.mount("https://", HTTPAdapter(max_retries=retries))
 
     # try pickle cookies method
     cookies = cj_from_pickle("pickled_cookies_works.txt")
     if cookies:
-        result = setup_session(contest_id, cookies)
+        result = setup_session(s, contest_id, cookies)
 
-        logger.debug("type(result): {}".format(type(result)))
+        logger.debug("type(result): %s", type(result))
         if result is False:
             logger.debug("Broken from pickle method")
         else:
@@ -61,8 +74,8 @@ def pull_contest_zip(contest_id):
                 new_expiry -= 11644473600
                 c.expires = new_expiry
 
-    result = setup_session(contest_id, cookies)
-    logger.debug("type(result): {}".format(type(result)))
+    result = setup_session(s, contest_id, cookies)
+    logger.debug("type(result): %s", type(result))
 
     if result:
         return result
@@ -86,8 +99,8 @@ def pull_contest_zip(contest_id):
                 new_expiry -= 11644473600
                 c.expires = new_expiry
 
-    result = setup_session(contest_id, cookies)
-    logger.debug("type(result): {}".format(type(result)))
+    result = setup_session(s, contest_id, cookies)
+    logger.debug("type(result): %s", type(result))
 
     if result is False:
         logger.debug("Broken from SECOND browsercookie method")
@@ -99,21 +112,30 @@ def pull_contest_zip(contest_id):
 def use_selenium(contest_id):
     url_contest_csv = f"https://www.draftkings.com/contest/exportfullstandingscsv/{contest_id}"
     bin_chromedriver = getenv("CHROMEDRIVER")
-    if not getenv("CHROMEDRIVER"):
-        exit("Could not find CHROMEDRIVER in env variable")
+    if not bin_chromedriver:
+        raise RuntimeError("Could not find CHROMEDRIVER in env variable")
 
-    logger.debug(f"Found chromedriver in env variable: {bin_chromedriver}")
+    logger.debug("Found chromedriver in env variable: %s", bin_chromedriver)
     # start headless webdriver
     service = chrome_service.Service(bin_chromedriver)
     service.start()
     logger.debug("Starting driver with options")
     options = webdriver.ChromeOptions()
     options.add_argument("--no-sandbox")
+    # nothing on the page is read, so skip rendering it
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-dev-shm-usage")
+    # don't download images, only the cookies set by the page matter
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     # options.add_argument("--user-data-dir=/Users/Adam/Library/Application Support/Google/Chrome")
     # options.add_argument("--profile-directory=Default")
-    driver = webdriver.Remote(service.service_url, desired_capabilities=options.to_capabilities())
+    capabilities = options.to_capabilities()
+    # return from driver.get() at DOMContentLoaded instead of waiting for every subresource
+    capabilities["pageLoadStrategy"] = "eager"
+    driver = webdriver.Remote(service.service_url, desired_capabilities=capabilities)
 
-    logger.debug("Performing get on {}".format(url_contest_csv))
+    logger.debug("Performing get on %s", url_contest_csv)
     driver.get(url_contest_csv)
     logger.debug(driver.current_url)
     logger.debug("Letting DK load ...")
@@ -126,46 +148,49 @@ def use_selenium(contest_id):
     driver.quit()
 
 
-def setup_session(contest_id, cookies):
-
-    s = requests.Session()
+def setup_session(s, contest_id, cookies):
+    # start each attempt from an empty cookie jar (the connection pool is kept)
+    s.cookies.clear()
     now = datetime.datetime.now()
+    now_ts = now.timestamp()
+
+    # cookies expiring before this timestamp get flagged
+    delta_hours = 5
+    warning_cutoff = now_ts + delta_hours * 3600
+    # the expiry checks only produce debug output, so skip them entirely without it
+    check_expiry = logger.isEnabledFor(logging.DEBUG)
 
     for c in cookies:
         # if the cookies already exists from a legitimate fresh session, clear them out
         if c.name in s.cookies:
-            logger.debug("removing {} from 'cookies' -- ".format(c.name), end="")
+            logger.debug("removing %s from 'cookies'", c.name)
             cookies.clear(c.domain, c.path, c.name)
         else:
-            if not c.expires:
+            if not check_expiry or not c.expires:
                 continue
 
             try:
-                if c.expires <= now.timestamp():
+                if c.expires <= now_ts:
                     logger.debug(
-                        "c.name {} has EXPIRED!!! (c.expires: {} now: {})".format(
-                            c.name, datetime.datetime.fromtimestamp(c.expires), now
-                        )
+                        "c.name %s has EXPIRED!!! (c.expires: %s now: %s)",
+                        c.name,
+                        datetime.datetime.fromtimestamp(c.expires),
+                        now,
                     )
-                else:  # check if
-                    delta_hours = 5
-                    d = datetime.datetime.fromtimestamp(c.expires) - datetime.timedelta(
-                        hours=delta_hours
+                # within 5 hours
+                elif c.expires <= warning_cutoff:
+                    expires = datetime.datetime.fromtimestamp(c.expires)
+                    logger.debug(
+                        "c.name %s expires within %s hours!! difference: %s (c.expires: %s now: %s)",
+                        c.name,
+                        delta_hours,
+                        expires - now,
+                        expires,
+                        now,
                     )
-                    # within 5 hours
-                    if d <= now:
-                        logger.debug(
-                            "c.name {} expires within {} hours!! difference: {} (c.expires: {} now: {})".format(
-                                c.name,
-                                delta_hours,
-                                datetime.datetime.fromtimestamp(c.expires) - now,
-                                datetime.datetime.fromtimestamp(c.expires),
-                                now,
-                            )
-                        )
             # some cookies have unnecessarily long expiration times which produce overflow errors
             except OverflowError as e:
-                logger.debug("Overflow on {} {} [error: {}]".format(c.name, c.expires, e))
+                logger.debug("Overflow on %s %s [error: %s]", c.name, c.expires, e)
 
     # exit()
     logger.debug("adding all missing cookies to session.cookies")
@@ -196,26 +221,25 @@ def request_contest_url(s, contest_id):
         # request will be a zip file
         z = zipfile.ZipFile(io.BytesIO(r.content))
         for name in z.namelist():
-            # extract file - it seems easier this way
-            z.extract(name)
-            with z.open(name) as csvfile:
-                logger.debug("name within zipfile: {}".format(name))
-                # convert to TextIOWrapper object
-                lines = io.TextIOWrapper(csvfile, encoding="utf-8", newline="\r\n")
-                # open reader object on csvfile within zip file
-                rdr = csv.reader(lines, delimiter=",")
+            logger.debug("name within zipfile: %s", name)
+            # decode the member in memory - the csv is written out below, so don't extract it too
+            csvfile = z.read(name).decode("utf-8")
+            # open reader object on csvfile within zip file
+            rdr = csv.reader(csvfile.splitlines(), delimiter=",")
 
     # write working cookies
     with open("pickled_cookies_works.txt", "wb") as f:
         pickle.dump(s.cookies, f)
 
+    # read the rows once so they can be both saved and returned
+    rows = list(rdr)
+
     # save csv to file
     with open(f"contest-standings-{contest_id}.csv", "w", newline="") as write_file:
         writer = csv.writer(write_file)
-        for line in rdr:
-            writer.writerow(line)
+        writer.writerows(rows)
 
-    return list(rdr)
+    return rows
 
 
 def cj_from_pickle(filename):
@@ -252,21 +276,25 @@ def main():
 
     logger.debug(args)
 
-    # pull contest standings from draftkings
-    contest_list = pull_contest_zip(args.id)
+    # pulling contest standings from draftkings and setting up the sheet are independent
+    # network round-trips, so run them at the same time
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        contest_future = executor.submit(pull_contest_zip, args.id)
+        sheet_future = executor.submit(DFSSheet, args.sport)
 
-    sheet = DFSSheet(args.sport)
+        contest_list = contest_future.result()
+        sheet = sheet_future.result()
 
-    logger.debug(f"Creating Results object Results({args.sport}, {args.id}, {args.csv})")
-    r = Results(args.sport, args.id, args.csv)
+    logger.debug("Creating Results object Results(%s, %s, %s)", args.sport, args.id, fn)
+    r = Results(args.sport, args.id, fn)
     z = r.players_to_values()
-    sheet.write_players(z)
     logger.info("Writing players to sheet")
-    sheet.add_last_updated(now)
 
     if r.vip_list:
         logger.info("Writing vip_lineups to sheet")
-        sheet.write_vip_lineups(r.vip_list)
+
+    # players, last updated and vip lineups all go out in a single request
+    sheet.write_results(z, now, r.vip_list)
 
     for u in r.vip_list:
         # logger.info("User: {}".format(u.name))